@@ -150,8 +150,8 @@ class AdaptiveLasso(Lasso):
         super()._set_param_values()
         assert self.canonicals_.parameters is not None
         length = len(self.canonicals_.parameters.adaptive_weights.value)
-        self.canonicals_.parameters.adaptive_weights.value = self.alpha * np.ones(
-            length
+        self.canonicals_.parameters.adaptive_weights.save_value(
+            self.alpha * np.ones(length)
         )
 
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
@@ -208,9 +208,16 @@ class AdaptiveLasso(Lasso):
         """Solve Lasso problem iteratively adaptive weights."""
         assert self.canonicals_.parameters is not None
         previous_weights = self._get_weights_value(self.canonicals_.parameters)
+        solver_options = dict(solver_options)
+        canon_backend = solver_options.pop(
+            "canon_backend", self._default_canon_backend(X)
+        )
         for i in range(self.max_iter):
             self.canonicals_.problem.solve(
-                solver=self.solver, warm_start=self.warm_start, **solver_options
+                solver=self._effective_solver,
+                warm_start=self.warm_start,
+                canon_backend=canon_backend,
+                **solver_options,
             )
             if (
                 self.canonicals_.beta.value is None
@@ -640,12 +647,12 @@ class AdaptiveSparseGroupLasso(AdaptiveLasso, SparseGroupLasso):
         group_weights = self.canonicals_.parameters.lambda1.value * np.ones_like(
             group_weights
         )
-        self.canonicals_.parameters.adaptive_group_weights.value = group_weights
+        self.canonicals_.parameters.adaptive_group_weights.save_value(group_weights)
         coef_weights = self.canonicals_.parameters.adaptive_coef_weights.value
         coef_weights = self.canonicals_.parameters.lambda1.value * np.ones_like(
             coef_weights
         )
-        self.canonicals_.parameters.adaptive_coef_weights.value = coef_weights
+        self.canonicals_.parameters.adaptive_coef_weights.save_value(coef_weights)
 
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
         # skip AdaptiveLasso in super
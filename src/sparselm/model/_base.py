@@ -7,22 +7,27 @@ from __future__ import annotations
 
 __author__ = "Luis Barroso-Luque, Fengyu Xie"
 
+import hashlib
+import importlib.util
+import os
+import tempfile
 import warnings
 from abc import ABCMeta, abstractmethod
 from collections.abc import Sequence
 from numbers import Integral
 from types import SimpleNamespace
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, cast
 
 import cvxpy as cp
 import numpy as np
+from cvxpy.atoms.affine.wraps import psd_wrap
 from numpy.typing import NDArray
+from scipy.sparse import issparse, spmatrix
 from sklearn.base import RegressorMixin
 from sklearn.linear_model._base import (
     LinearModel,
     _check_sample_weight,
     _preprocess_data,
-    _rescale_data,
 )
 from sklearn.utils._param_validation import (
     Interval,
@@ -35,6 +40,29 @@ from sklearn.utils._param_validation import (
 )
 
 
+def _array_fingerprint(arr: NDArray | spmatrix) -> tuple:
+    """Compute a cheap fingerprint of an array to detect changed fit data.
+
+    A single hashing pass over the raw buffer replaces the full element-wise
+    comparison against a cached copy of the data. Sparse matrices are hashed
+    over their underlying index and data buffers.
+    """
+    if issparse(arr):
+        sparse_arr = cast(spmatrix, arr)
+        hasher = hashlib.blake2b(digest_size=8)
+        for buffer in (sparse_arr.data, sparse_arr.indices, sparse_arr.indptr):
+            hasher.update(np.ascontiguousarray(buffer).data)
+        return (
+            sparse_arr.shape,
+            sparse_arr.format,
+            sparse_arr.dtype.str,
+            hasher.digest(),
+        )
+    buffer = arr.data if arr.flags.c_contiguous else arr.tobytes()
+    digest = hashlib.blake2b(buffer, digest_size=8).digest()
+    return arr.shape, arr.dtype.str, digest
+
+
 class CVXCanonicals(NamedTuple):
     """CVXpy Canonical objects representing the underlying optimization problem.
 
@@ -45,9 +73,11 @@ class CVXCanonicals(NamedTuple):
             Objective function.
         beta (cp.Variable):
             Variable to be optimized (corresponds to the estimated coef_ attribute).
-        parameters (SimpleNamespace of cp.Parameter or NDArray):
-            SimpleNamespace with named cp.Parameter objects or NDArray of parameters.
-            The namespace should be defined by the Regressor generating it.
+        parameters (namespace of cp.Parameter or NDArray):
+            Namespace with named cp.Parameter objects or NDArray of parameters.
+            The namespace should be defined by the Regressor generating it. It
+            is built as a SimpleNamespace and converted to a slotted container
+            once the problem is fully generated.
         auxiliaries (SimpleNamespace of cp.Variable or cp.Expression):
             SimpleNamespace with auxiliary cp.Variable or cp.Expression objects.
             The namespace should be defined by the Regressor generating it.
@@ -66,6 +96,47 @@ class CVXCanonicals(NamedTuple):
     user_constraints: list[cp.Constraint]
 
 
+# cache of generated slotted parameter classes keyed by their attribute names
+_parameter_classes: dict[frozenset, type] = {}
+
+
+def _unpickle_slotted_parameters(state: dict) -> Any:
+    """Rebuild a slotted parameter container from its attribute dict."""
+    return _slotted_parameters(SimpleNamespace(**state))
+
+
+def _reduce_slotted_parameters(self) -> tuple:
+    """Pickle instances of the dynamically generated parameter classes."""
+    state = {name: getattr(self, name) for name in self.__slots__}
+    return _unpickle_slotted_parameters, (state,)
+
+
+def _slotted_parameters(namespace: SimpleNamespace) -> Any:
+    """Convert a namespace of cvxpy Parameters to a slotted container.
+
+    Slotted attribute access skips the instance __dict__ lookup, which adds up
+    on the per-fit hot paths that read parameters by name. The parameter
+    namespace is mutated freely while the problem is generated, so conversion
+    only happens once the attribute set is final. The generated class is cached
+    by its attribute names so repeated problem generations reuse it.
+    """
+    attrs = vars(namespace)
+    key = frozenset(attrs)
+    cls = _parameter_classes.get(key)
+    if cls is None:
+        # dataclasses only support slots=True for python >= 3.10
+        cls = type(
+            "CVXParameters",
+            (),
+            {"__slots__": tuple(attrs), "__reduce__": _reduce_slotted_parameters},
+        )
+        _parameter_classes[key] = cls
+    slotted = cls()
+    for name, value in attrs.items():
+        setattr(slotted, name, value)
+    return slotted
+
+
 class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
     r"""Abstract base class for Regressors using cvxpy with a sklearn interface.
 
@@ -124,6 +195,41 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
     }
     # parameter constraints that require a cvxpy Parameter object in problem definition
     _cvx_parameter_constraints: dict[str, list[Any]] | None = None
+    # merged view of the above; recomputed for subclasses in __init_subclass__
+    _merged_parameter_constraints: dict[str, list[Any]] = _parameter_constraints
+
+    # preferred solvers used when solver=None, in order of preference. The first
+    # installed one is chosen instead of falling through to cvxpy's default.
+    # All of these handle the LP/QP/SOCP problems generated by the convex
+    # regressors; mixed-integer subclasses override with MIQP-capable solvers.
+    _preferred_solvers: tuple[str, ...] = ("MOSEK", "CLARABEL", "ECOS", "SCS")
+
+    # Whether the regression objective is expected to be representable as a
+    # (piecewise-affine) quadratic program. Subclasses with inherently conic
+    # objectives (e.g. group norms) should set this to False to silence the
+    # QP-representability check in generate_problem.
+    _prefer_qp: bool = True
+
+    # maximum number of entries in X for embedding the data as cvxpy
+    # Parameters in generate_problem. Canonicalizing a parametrized X becomes
+    # far more expensive than regenerating the problem as it grows, so only
+    # small problems benefit from data-parameter reuse across fits.
+    _data_param_max_size: int = 1000
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Merge the cvxpy parameter constraints into the sklearn ones.
+
+        Computed once per class instead of allocating a merged dict on every
+        call to _validate_params.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls._cvx_parameter_constraints is None:
+            cls._merged_parameter_constraints = cls._parameter_constraints
+        else:
+            cls._merged_parameter_constraints = {
+                **cls._parameter_constraints,
+                **cls._cvx_parameter_constraints,
+            }
 
     def __init__(
         self,
@@ -171,28 +277,34 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
             instance of self
         """
         X, y = self._validate_data(
-            X, y, accept_sparse=False, y_numeric=True, multi_output=False
+            X, y, accept_sparse=("csr", "csc"), y_numeric=True, multi_output=False
         )
 
         X, y, X_offset, y_offset, X_scale = self._preprocess_data(X, y, sample_weight)
 
         self._validate_params(X, y)
 
-        # TODO test theses cases
+        # Since the problem is DPP, repeated fits with the same data only require
+        # setting new hyperparameter values. When the data (X, y) is embedded as
+        # cvxpy Parameters, fitting new data of the same shape only requires
+        # updating the data parameter values, and a full problem regeneration is
+        # only needed when the problem structure changes.
         if not hasattr(self, "canonicals_"):
             self.generate_problem(X, y, preprocess_data=False)
-        elif not np.array_equal(self.cached_X_, X) or not np.array_equal(
-            self.cached_y_, y
-        ):
-            if self.canonicals_.user_constraints:
-                warnings.warn(
-                    "User constraints are set on a problem with different data (X, y). "
-                    "These constraints will be ignored.",
-                    UserWarning,
-                )
+        elif self._is_cached_data(X, y):
+            self._set_param_values()  # set parameter values
+        elif self.canonicals_.user_constraints:
+            warnings.warn(
+                "User constraints are set on a problem with different data (X, y). "
+                "These constraints will be ignored.",
+                UserWarning,
+            )
             self.generate_problem(X, y, preprocess_data=False)
-        else:
+        elif self._can_reuse_problem(X, y):
+            self._update_data_params(X, y)
             self._set_param_values()  # set parameter values
+        else:
+            self.generate_problem(X, y, preprocess_data=False)
 
         solver_options = self.solver_options if self.solver_options is not None else {}
         if not isinstance(solver_options, dict):
@@ -205,13 +317,30 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
         return self
 
     def _preprocess_data(
-        self, X: NDArray, y: NDArray, sample_weight: NDArray[np.floating] | None = None
-    ) -> tuple[NDArray, NDArray, NDArray, NDArray, NDArray]:
+        self,
+        X: NDArray | spmatrix,
+        y: NDArray,
+        sample_weight: NDArray[np.floating] | None = None,
+    ) -> tuple[NDArray | spmatrix, NDArray, NDArray, NDArray, NDArray]:
         """Preprocess data for fitting."""
+        if issparse(X) and self.fit_intercept:
+            # sklearn's _preprocess_data leaves sparse X uncentered while still
+            # centering y and returning the feature means that _set_intercept
+            # assumes were subtracted; fitting uncentered X against centered y
+            # gives a wrong model. The objectives cannot account for the offset
+            # without densifying anyway, so densify up front to center properly.
+            X = cast(spmatrix, X).toarray()
+
         if sample_weight is not None:
-            sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+            checked_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
             # rescale sample_weight to sum to number of samples
-            sample_weight = sample_weight * (X.shape[0] / np.sum(sample_weight))  # type: ignore
+            scale = X.shape[0] / checked_weight.sum()
+            if checked_weight is sample_weight:
+                # do not overwrite the caller's array
+                sample_weight = checked_weight * scale
+            else:
+                np.multiply(checked_weight, scale, out=checked_weight)
+                sample_weight = checked_weight
 
         X, y, X_offset, y_offset, X_scale = _preprocess_data(
             X,
@@ -222,7 +351,16 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
         )
 
         if sample_weight is not None:
-            X, y, _ = _rescale_data(X, y, sample_weight)
+            # rescale in place: at this point X is either a fresh copy made by
+            # _preprocess_data (copy_X=True) or the user allowed overwriting it
+            # (copy_X=False), and y is always copied by _preprocess_data.
+            sqrt_sw = np.sqrt(sample_weight)
+            if issparse(X):
+                sparse_X = cast(spmatrix, X)
+                X = sparse_X.multiply(sqrt_sw[:, np.newaxis]).asformat(sparse_X.format)
+            else:
+                X *= sqrt_sw[:, np.newaxis]
+            y *= sqrt_sw
 
         return X, y, X_offset, y_offset, X_scale
 
@@ -231,34 +369,123 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
 
         Implement this in an Regressor for additional parameter value validation.
         """
-        if self._cvx_parameter_constraints is None:
-            parameter_constraints = self._parameter_constraints
-        else:
-            parameter_constraints = {
-                **self._parameter_constraints,
-                **self._cvx_parameter_constraints,
-            }
         validate_parameter_constraints(
-            parameter_constraints,
+            self._merged_parameter_constraints,
             self.get_params(deep=False),
             caller_name=self.__class__.__name__,
         )
 
+    @classmethod
+    def _get_param_names(cls) -> list[str]:
+        """Return the sorted names of the constructor parameters.
+
+        sklearn's implementation inspects the __init__ signature on every call,
+        which shows up in tight CV loops where get_params runs on each fit and
+        clone. The names are static per class, so they are computed only once.
+        """
+        if "_cached_param_names" not in cls.__dict__:
+            cls._cached_param_names = super()._get_param_names()
+        return cls._cached_param_names
+
+    @classmethod
+    def _get_default_solver(cls) -> str | None:
+        """Return the first installed preferred solver.
+
+        The installed solvers are only probed once per class, not per solve.
+        """
+        if "_default_solver" not in cls.__dict__:
+            installed = cp.installed_solvers()
+            cls._default_solver = next(
+                (solver for solver in cls._preferred_solvers if solver in installed),
+                None,
+            )
+        return cls._default_solver
+
+    @property
+    def _effective_solver(self) -> str | None:
+        """The solver passed to cvxpy: the user's choice or the preferred default."""
+        return self.solver if self.solver is not None else self._get_default_solver()
+
+    def _supports_data_parameters(self) -> bool:
+        """Whether the problem can embed X, y as cvxpy Parameters.
+
+        When supported, the canonicalized problem is reused for repeated fits with
+        new data of the same shape by simply updating the data parameter values.
+        Subclasses whose problem structure depends on the numeric values of the
+        data should return False.
+        """
+        return True
+
+    def _can_reuse_problem(self, X: NDArray, y: NDArray) -> bool:
+        """Check if the generated problem can be reused with new data X, y."""
+        parameters = self.canonicals_.parameters
+        X_param = getattr(parameters, "X", None)
+        y_param = getattr(parameters, "y", None)
+        return (
+            X_param is not None
+            and y_param is not None
+            and X_param.shape == X.shape
+            and y_param.shape == y.shape
+        )
+
+    def _update_data_params(self, X: NDArray, y: NDArray) -> None:
+        """Update the values of the cvxpy Parameters holding the data X, y.
+
+        save_value bypasses the validating value setter; X and y have already
+        been validated and match the parameter shapes when this is called.
+        """
+        parameters = self.canonicals_.parameters
+        assert parameters is not None
+        parameters.X.save_value(X)
+        parameters.y.save_value(y)
+        self._cache_data(X, y)
+
+    def _cache_data(self, X: NDArray, y: NDArray) -> None:
+        """Cache fingerprints of the fit data to detect changed data.
+
+        Only the fingerprints are kept; holding a reference to the preprocessed
+        arrays would keep an extra n_samples x n_features copy alive between
+        fits. Plain ndarrays cannot be weak-referenced, so there is no way to
+        keep an identity check without also keeping the data alive.
+        """
+        self._cached_X_fingerprint = _array_fingerprint(X)
+        self._cached_y_fingerprint = _array_fingerprint(y)
+
+    def _is_cached_data(self, X: NDArray, y: NDArray) -> bool:
+        """Check if X, y is the same data the problem was generated with.
+
+        Fingerprints are compared in a single hashing pass over the raw
+        buffers, so this never requires an element-wise scan of cached data.
+        """
+        return _array_fingerprint(X) == getattr(
+            self, "_cached_X_fingerprint", None
+        ) and _array_fingerprint(y) == getattr(self, "_cached_y_fingerprint", None)
+
     def _set_param_values(self) -> None:
         """Set the values of cvxpy parameters from param attributes for warm starts."""
         if self._cvx_parameter_constraints is None:
             return
 
-        for parameter, value in self.get_params(deep=False).items():
-            if parameter in self._cvx_parameter_constraints:
-                cvx_parameter = getattr(self.canonicals_.parameters, parameter)
-                # check for parameters that take a scalar or an array
-                if isinstance(value, np.ndarray) or isinstance(value, Sequence):
-                    if len(value) == 1:
-                        value = value * np.ones_like(cvx_parameter.value)
-                    else:
-                        value = np.asarray(value)
-                cvx_parameter.value = value
+        # cache the (name, Parameter) pairs to avoid introspecting the class with
+        # get_params on every solve; invalidated when the problem is regenerated
+        parameters = self.canonicals_.parameters
+        cached = getattr(self, "_cvx_parameter_items", None)
+        if cached is None or cached[0] is not parameters:
+            items = [
+                (name, getattr(parameters, name))
+                for name in self._cvx_parameter_constraints
+            ]
+            self._cvx_parameter_items = cached = (parameters, items)
+
+        for name, cvx_parameter in cached[1]:
+            value = getattr(self, name)
+            # check for parameters that take a scalar or an array
+            if isinstance(value, np.ndarray) or isinstance(value, Sequence):
+                # zero-copy broadcast handles length-1 values for array parameters
+                value = np.broadcast_to(np.asarray(value), cvx_parameter.shape)
+            # save_value skips the validating setter; values read from estimator
+            # attributes have already been validated against the constraints
+            cvx_parameter.save_value(value)
 
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
         """Return the named tuple of cvxpy parameters for optimization problem.
@@ -280,25 +507,26 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
             if self._cvx_parameter_constraints is None
             else self._cvx_parameter_constraints
         )
-        for param_name, param_val in self.get_params(deep=False).items():
-            if param_name not in cvx_constraints:
-                continue
+        for param_name, param_constraints in cvx_constraints.items():
+            param_val = getattr(self, param_name)
 
             # make constraints sklearn constraint objects
             constraints = [
-                make_constraint(constraint)
-                for constraint in cvx_constraints[param_name]
+                make_constraint(constraint) for constraint in param_constraints
             ]
 
+            # convert array-like values once before scanning the constraints
+            if not hasattr(param_val, "shape") and any(
+                isinstance(constraint, _ArrayLikes) for constraint in constraints
+            ):
+                param_val = np.asarray(param_val)
+
             # For now we will only set nonneg, nonpos, neg, pos, integer, boolean and/or
             # shape of the cvxpy Parameter objects.
             # TODO cxvpy only allows a single one of these to be set (except bool and integer)
             param_kwargs = {}
             for constraint in constraints:
                 if isinstance(constraint, _ArrayLikes):
-                    if not hasattr(param_val, "shape"):
-                        param_val = np.asarray(param_val)
-
                     param_kwargs["shape"] = param_val.shape
 
                 if isinstance(constraint, _Booleans):
@@ -329,9 +557,11 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
                                 param_kwargs["neg"] = True
                         elif constraint.right < 0:
                             param_kwargs["neg"] = True
-                cvx_parameters[param_name] = cp.Parameter(
-                    value=param_val, **param_kwargs
-                )
+
+            # create the Parameter only once with the aggregated kwargs
+            cvx_parameters[param_name] = cp.Parameter(
+                name=param_name, value=param_val, **param_kwargs
+            )
 
         return SimpleNamespace(**cvx_parameters)
 
@@ -368,6 +598,12 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
 
         The objective must be stated for a minimization problem.
 
+        Write squared error terms with cp.sum_squares rather than
+        cp.norm(..., 2)**2: they are mathematically equivalent but sum_squares
+        keeps the objective QP-representable, while the norm form is
+        canonicalized through a second-order cone and solves notably slower
+        on QP-capable solvers.
+
         Args:
             X (NDArray):
                 Covariate/Feature matrix
@@ -447,15 +683,54 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
 
         # X, y are cached to avoid re-generating problem if fit is called again with
         # same data
-        self.cached_X_ = X
-        self.cached_y_ = y
+        self._cache_data(X, y)
 
         beta = cp.Variable(X.shape[1])
         parameters = self._generate_params(X, y)
-        auxiliaries = self._generate_auxiliaries(X, y, beta, parameters)
-        objective = self._generate_objective(X, y, beta, parameters, auxiliaries)
-        constraints = self._generate_constraints(X, y, beta, parameters, auxiliaries)
+
+        # Embed the data as cvxpy Parameters when supported, so the canonicalized
+        # problem can be reused with new data of the same shape (e.g. CV folds)
+        # by only updating the parameter values. This only pays off for small
+        # problems: canonicalizing a parametrized X grows much faster than the
+        # problem size, so above the size limit the data is embedded as a
+        # constant and refits regenerate the problem instead. Sparse X is
+        # always embedded as a sparse constant, since cvxpy cannot stuff
+        # sparse parameter values.
+        if (
+            self._supports_data_parameters()
+            and not issparse(X)
+            and X.size <= self._data_param_max_size
+        ):
+            parameters.X = cp.Parameter(shape=X.shape, name="X", value=X)
+            parameters.y = cp.Parameter(shape=y.shape, name="y", value=y)
+            X_data, y_data = cast(NDArray, parameters.X), cast(NDArray, parameters.y)
+        else:
+            X_data, y_data = X, y
+
+        auxiliaries = self._generate_auxiliaries(X_data, y_data, beta, parameters)
+        objective = self._generate_objective(
+            X_data, y_data, beta, parameters, auxiliaries
+        )
+        constraints = self._generate_constraints(
+            X_data, y_data, beta, parameters, auxiliaries
+        )
+        if self._prefer_qp and not objective.is_qpwa():
+            warnings.warn(
+                f"The objective generated by {self.__class__.__name__} is not "
+                "representable as a quadratic program, so QP-capable solvers "
+                "will fall back to a slower conic formulation. Use cp.sum_squares "
+                "instead of cp.norm(..., 2)**2 when writing squared error terms, "
+                "or set _prefer_qp = False if the objective is inherently conic.",
+                UserWarning,
+            )
+
         problem = cp.Problem(cp.Minimize(objective), constraints)
+        # A DPP compliant problem allows cvxpy to reuse the canonicalized problem
+        # in subsequent solves, such that repeated fits with new hyperparameter
+        # values only require setting cvxpy Parameter values.
+        assert problem.is_dpp()
+        # the parameter set is final here; convert to slotted attribute access
+        parameters = _slotted_parameters(parameters)
         self.canonicals_ = CVXCanonicals(
             problem=problem,
             objective=objective,
@@ -509,13 +784,111 @@ class CVXRegressor(RegressorMixin, LinearModel, metaclass=ABCMeta):
             user_constraints=self.canonicals_.user_constraints,
         )
 
+    def generate_codegen_solver(self, code_dir: str | None = None) -> None:
+        """Generate compiled C solver code for the problem using cvxpygen.
+
+        Subsequent solves are routed through the generated solver, bypassing
+        cvxpy's Python canonicalization and dispatch overhead each solve. This
+        is most useful when fitting the same estimator repeatedly with fixed
+        data shapes (e.g. over many CV folds).
+
+        Requires the optional cvxpygen package. The generated solver is tied to
+        the current problem, so it is bypassed if the problem is regenerated
+        (i.e. if fit is given data of a different shape).
+
+        The directory holding the generated code is recorded in the
+        codegen_dir_ attribute. When code_dir is not given a temporary
+        directory is created, which is not removed automatically; clean it up
+        through codegen_dir_ once the solver is no longer needed.
+
+        Args:
+            code_dir (str): optional
+                Directory to write the generated code to. A temporary directory
+                is created if not given.
+        """
+        if not hasattr(self, "canonicals_"):
+            raise RuntimeError(
+                "Problem has not been generated. Please call generate_problem before"
+                " generating solver code."
+            )
+        try:
+            from cvxpygen import cpg
+        except ImportError as error:
+            raise ImportError(
+                "cvxpygen must be installed to generate solver code."
+            ) from error
+
+        if code_dir is None:
+            code_dir = tempfile.mkdtemp(prefix="sparselm_cpg_")
+
+        cpg.generate_code(
+            self.canonicals_.problem, code_dir=code_dir, solver=self._effective_solver
+        )
+        spec = importlib.util.spec_from_file_location(
+            "cpg_solver", os.path.join(code_dir, "cpg_solver.py")
+        )
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        # keep the solve callable on the instance rather than in cvxpy's
+        # class-level register_solve registry, which is shared by every problem
+        # in the process and would let one estimator's solver overwrite
+        # another's. The generated code is only valid for this exact problem.
+        self._cpg_solve = module.cpg_solve
+        self._codegen_problem = self.canonicals_.problem
+        self.codegen_dir_ = code_dir
+
+    def _default_canon_backend(self, X: NDArray) -> str | None:
+        """Pick a canonicalization backend based on the problem data.
+
+        cvxpy's default CPP backend has the lowest overhead for small dense
+        problems, while the SCIPY backend canonicalizes large or sparse data
+        considerably faster. Returning None falls through to cvxpy's default.
+        """
+        if issparse(X) or X.size >= 1e5:
+            return "SCIPY"
+        return None
+
     def _solve(
         self, X: NDArray, y: NDArray, solver_options: dict, *args, **kwargs
     ) -> NDArray[np.floating]:
         """Solve the cvxpy problem."""
-        self.canonicals_.problem.solve(
-            solver=self.solver, warm_start=self.warm_start, **solver_options
+        problem = self.canonicals_.problem
+        solver_options = dict(solver_options)
+        canon_backend = solver_options.pop(
+            "canon_backend", self._default_canon_backend(X)
         )
+        if getattr(self, "_codegen_problem", None) is problem:
+            # calling the generated solver directly is equivalent to
+            # problem.solve(method=...) without the shared method registry
+            self._cpg_solve(problem, **solver_options)
+        elif self.warm_start:
+            # solve through the cached canonicalization chain directly; repeated
+            # warm-started solves then only re-evaluate parameter values and hit
+            # the persistent solver cache, skipping cvxpy's full solve dispatch
+            verbose = solver_options.pop("verbose", False)
+            data, chain, inverse_data = problem.get_problem_data(
+                solver=self._effective_solver,
+                verbose=verbose,
+                canon_backend=canon_backend,
+                solver_opts=solver_options,
+            )
+            solution = chain.solve_via_data(
+                problem,
+                data,
+                warm_start=True,
+                verbose=verbose,
+                solver_opts=solver_options,
+            )
+            problem.unpack_results(solution, chain, inverse_data)
+        else:
+            problem.solve(
+                solver=self._effective_solver,
+                warm_start=self.warm_start,
+                canon_backend=canon_backend,
+                **solver_options,
+            )
         return self.canonicals_.beta.value
 
 
@@ -527,6 +900,27 @@ class TikhonovMixin:
     otherwise simple l2/Ridge is used.
     """
 
+    # set by the estimator classes using this mixin; a dense or sparse matrix
+    # or None for the simple l2/Ridge term
+    tikhonov_w: NDArray | Any
+
+    def _tikhonov_quad_matrix(self) -> NDArray | Any:
+        """Return the matrix W.T @ W used in the regularization quadratic form.
+
+        The matrix is cached so repeated problem generations with the same
+        tikhonov_w do not recompute the product.
+        """
+        cached = getattr(self, "_tikhonov_Q", None)
+        if cached is None or cached[0] is not self.tikhonov_w:
+            tikhonov_w = self.tikhonov_w
+            if issparse(tikhonov_w):
+                quad_matrix = (tikhonov_w.T @ tikhonov_w).tocsc()
+            else:
+                tikhonov_w = np.atleast_2d(tikhonov_w)
+                quad_matrix = tikhonov_w.T @ tikhonov_w
+            self._tikhonov_Q = cached = (self.tikhonov_w, quad_matrix)
+        return cached[1]
+
     def _generate_objective(
         self,
         X: NDArray,
@@ -536,13 +930,19 @@ class TikhonovMixin:
         auxiliaries: SimpleNamespace | None = None,
     ) -> cp.Expression:
         """Add a Tikhnonov regularization term to the objective function."""
-        if hasattr(self, "tikhonov_w") and self.tikhonov_w is not None:
-            tikhonov_w = self.tikhonov_w
-        else:
-            tikhonov_w = np.eye(X.shape[1])
         assert parameters is not None and hasattr(parameters, "eta")
         c0 = 2 * X.shape[0]  # keeps hyperparameter scale independent
         objective = super()._generate_objective(X, y, beta, parameters, auxiliaries)  # type: ignore
-        objective += c0 * parameters.eta * cp.sum_squares(tikhonov_w @ beta)
+        if getattr(self, "tikhonov_w", None) is not None:
+            # precomputed W.T @ W halves the canonicalization work relative to
+            # expanding cp.sum_squares(W @ beta) symbolically
+            objective += (
+                c0
+                * parameters.eta
+                * cp.quad_form(beta, psd_wrap(self._tikhonov_quad_matrix()))
+            )
+        else:
+            # a simple l2/ridge penalty; skips materializing an identity matrix
+            objective += c0 * parameters.eta * cp.sum_squares(beta)
 
         return objective
@@ -18,17 +18,18 @@ import warnings
 from collections.abc import Sequence
 from numbers import Real
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, cast
 
 import cvxpy as cp
 import numpy as np
 from numpy.typing import NDArray
 from scipy.linalg import sqrtm
+from scipy.sparse import issparse, spmatrix
 from sklearn.utils._param_validation import Interval
 from sklearn.utils.validation import check_scalar
 
 from .._utils.validation import _check_group_weights, _check_groups
-from ._base import CVXCanonicals, CVXRegressor
+from ._base import CVXCanonicals, CVXRegressor, _slotted_parameters
 
 
 class Lasso(CVXRegressor):
@@ -180,6 +181,9 @@ class GroupLasso(Lasso):
                 - constraints - solution constraints
     """
 
+    # group norms make the objective second-order cone representable, not QP
+    _prefer_qp: bool = False
+
     def __init__(
         self,
         groups: NDArray[np.floating | np.integer] | None = None,
@@ -227,6 +231,10 @@ class GroupLasso(Lasso):
         if self.group_weights is not None:
             self.canonicals_.parameters.group_weights = self.group_weights
 
+    def _supports_data_parameters(self) -> bool:
+        """Standardized group norms are not DPP in the data parameters."""
+        return not self.standardize
+
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
         parameters = super()._generate_params(X, y)
         n_groups = X.shape[1] if self.groups is None else len(np.unique(self.groups))
@@ -390,6 +398,10 @@ class OverlapGroupLasso(GroupLasso):
 
         _check_group_weights(self.group_weights, n_groups)
 
+    def _supports_data_parameters(self) -> bool:
+        """The problem embeds an augmented copy of X based on the group list."""
+        return False
+
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
         parameters = super()._generate_params(X, y)
 
@@ -432,8 +444,7 @@ class OverlapGroupLasso(GroupLasso):
 
         # X, y are cached to avoid re-generating problem if fit is called again with
         # same data
-        self.cached_X_ = X
-        self.cached_y_ = y
+        self._cache_data(X, y)
 
         # need to generate the auxiliaries here since the problem data is "augmented"
         # based on them
@@ -473,6 +484,8 @@ class OverlapGroupLasso(GroupLasso):
         )
         problem = cp.Problem(cp.Minimize(objective), constraints)
 
+        # the parameter set is final here; convert to slotted attribute access
+        parameters = _slotted_parameters(parameters)
         self.canonicals_ = CVXCanonicals(
             problem=problem,
             objective=objective,
@@ -485,8 +498,15 @@ class OverlapGroupLasso(GroupLasso):
 
     def _solve(self, X, y, solver_options, *args, **kwargs) -> NDArray[np.floating]:
         """Solve the cvxpy problem."""
+        solver_options = dict(solver_options)
+        canon_backend = solver_options.pop(
+            "canon_backend", self._default_canon_backend(X)
+        )
         self.canonicals_.problem.solve(
-            solver=self.solver, warm_start=self.warm_start, **solver_options
+            solver=self._effective_solver,
+            warm_start=self.warm_start,
+            canon_backend=canon_backend,
+            **solver_options,
         )
         assert self.canonicals_.auxiliaries is not None
         beta = np.array(
@@ -610,8 +630,8 @@ class SparseGroupLasso(GroupLasso):
     def _set_param_values(self) -> None:
         super()._set_param_values()
         assert self.canonicals_.parameters is not None
-        self.canonicals_.parameters.lambda1.value = self.l1_ratio * self.alpha
-        self.canonicals_.parameters.lambda2.value = (1 - self.l1_ratio) * self.alpha
+        self.canonicals_.parameters.lambda1.save_value(self.l1_ratio * self.alpha)
+        self.canonicals_.parameters.lambda2.save_value((1 - self.l1_ratio) * self.alpha)
 
     def _generate_params(self, X: NDArray, y: NDArray) -> SimpleNamespace:
         """Generate parameters."""
@@ -766,7 +786,7 @@ class RidgedGroupLasso(GroupLasso):
 
     @staticmethod
     def _generate_group_norms(
-        X: NDArray,
+        X: NDArray | spmatrix,
         groups: NDArray,
         beta: cp.Variable,
         standardize: bool,
@@ -775,6 +795,9 @@ class RidgedGroupLasso(GroupLasso):
         group_masks = [groups == i for i in np.sort(np.unique(groups))]
         if standardize:
             assert parameters is not None
+            if issparse(X):
+                # sqrtm of the group gram matrices needs dense blocks
+                X = cast(spmatrix, X).toarray()
             group_norms = cp.hstack(
                 [
                     cp.norm2(
@@ -73,6 +73,9 @@ class MIQPl0(CVXRegressor, metaclass=ABCMeta):
         "big_M": [Interval(type=Real, left=0.0, right=None, closed="left")]
     }
 
+    # mixed-integer capable solvers to default to when solver=None
+    _preferred_solvers: tuple[str, ...] = ("GUROBI", "SCIP", "ECOS_BB")
+
     @abstractmethod  # force inspect.isabstract to return True
     def __init__(
         self,
@@ -104,6 +107,10 @@ class MIQPl0(CVXRegressor, metaclass=ABCMeta):
         super()._validate_params(X, y)
         _check_groups(self.groups, X.shape[1])
 
+    def _supports_data_parameters(self) -> bool:
+        """The quadratic form X.T @ X must be computed numerically."""
+        return False
+
     def _generate_auxiliaries(
         self, X: NDArray, y: NDArray, beta: cp.Variable, parameters: SimpleNamespace
     ) -> SimpleNamespace | None:
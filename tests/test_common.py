@@ -3,12 +3,15 @@
 Simply check that they execute successfully on random data.
 """
 
+from importlib.util import find_spec
 from inspect import getmembers, isclass, signature
 
 import cvxpy as cp
 import numpy as np
+import numpy.testing as npt
 import pytest
 from cvxpy.error import SolverError
+from scipy import sparse
 from sklearn.utils.estimator_checks import check_estimator
 from sklearn.utils.fixes import threadpool_info
 
@@ -67,6 +70,100 @@ def test_general_fit(estimator_cls, random_model, rng):
     assert estimator.intercept_ != 0.0
 
 
+def test_generate_codegen_solver_errors(random_model):
+    X, y, beta = random_model
+    estimator = spm.OrdinaryLeastSquares()
+
+    # the problem must be generated before generating solver code
+    with pytest.raises(RuntimeError):
+        estimator.generate_codegen_solver()
+
+    estimator.generate_problem(X, y)
+    if find_spec("cvxpygen") is None:
+        # cvxpygen is an optional dependency
+        with pytest.raises(ImportError):
+            estimator.generate_codegen_solver()
+
+
+@pytest.mark.parametrize("estimator_cls", [spm.OrdinaryLeastSquares, spm.Lasso])
+def test_data_parameter_reuse(estimator_cls):
+    # use a local rng to avoid advancing the shared package-scoped stream
+    rng = np.random.default_rng(42)
+    X = rng.random((40, 10))
+    y = X @ rng.random(10) + rng.normal(scale=0.01, size=40)
+
+    estimator = estimator_cls(fit_intercept=False)
+    estimator.fit(X, y)
+    # small problems embed the data as cvxpy Parameters
+    assert isinstance(estimator.canonicals_.parameters.X, cp.Parameter)
+    assert isinstance(estimator.canonicals_.parameters.y, cp.Parameter)
+    problem = estimator.canonicals_.problem
+
+    # fitting new data of the same shape reuses the canonicalized problem and
+    # must give the same solution as a freshly generated one
+    X_new = rng.random((40, 10))
+    y_new = X_new @ rng.random(10) + rng.normal(scale=0.01, size=40)
+    estimator.fit(X_new, y_new)
+    assert estimator.canonicals_.problem is problem
+
+    fresh_estimator = estimator_cls(fit_intercept=False)
+    fresh_estimator.fit(X_new, y_new)
+    npt.assert_allclose(estimator.coef_, fresh_estimator.coef_, atol=1e-6)
+
+    # a shape change forces a full problem regeneration
+    X_wide = rng.random((40, 12))
+    y_wide = X_wide @ rng.random(12) + rng.normal(scale=0.01, size=40)
+    estimator.fit(X_wide, y_wide)
+    assert estimator.canonicals_.problem is not problem
+    assert len(estimator.coef_) == 12
+
+    # above the size limit the data is embedded as constants instead, since
+    # canonicalizing a parametrized X is slower than regenerating the problem
+    n_samples = estimator._data_param_max_size // 10 + 1
+    X_large = rng.random((n_samples, 10))
+    y_large = X_large @ rng.random(10) + rng.normal(scale=0.01, size=n_samples)
+    estimator.fit(X_large, y_large)
+    assert getattr(estimator.canonicals_.parameters, "X", None) is None
+
+
+@pytest.mark.parametrize("sparse_format", ["csr", "csc"])
+@pytest.mark.parametrize("estimator_cls", [spm.OrdinaryLeastSquares, spm.Lasso])
+def test_sparse_input(estimator_cls, sparse_format):
+    # use a local rng to avoid advancing the shared package-scoped stream
+    rng = np.random.default_rng(42)
+    X = rng.random((50, 10)) * (rng.random((50, 10)) > 0.7)
+    y = X @ rng.random(10) + rng.normal(scale=0.01, size=50)
+    X_sparse = getattr(sparse, f"{sparse_format}_matrix")(X)
+
+    # without an intercept dense and sparse fits must match exactly
+    estimator = estimator_cls(fit_intercept=False)
+    estimator.fit(X, y)
+    sparse_estimator = estimator_cls(fit_intercept=False)
+    sparse_estimator.fit(X_sparse, y)
+    npt.assert_allclose(estimator.coef_, sparse_estimator.coef_, atol=1e-8)
+    npt.assert_allclose(
+        estimator.predict(X), sparse_estimator.predict(X_sparse), atol=1e-8
+    )
+
+    # sample weights keep sparsity through the rescaling branch
+    sample_weight = rng.random(50)
+    estimator.fit(X, y, sample_weight=sample_weight)
+    sparse_estimator.fit(X_sparse, y, sample_weight=sample_weight)
+    npt.assert_allclose(estimator.coef_, sparse_estimator.coef_, atol=1e-8)
+
+    # with an intercept sparse X is densified so it can be centered, and the
+    # fit must match the dense fit exactly
+    estimator = estimator_cls(fit_intercept=True)
+    estimator.fit(X, y)
+    sparse_estimator = estimator_cls(fit_intercept=True)
+    sparse_estimator.fit(X_sparse, y)
+    npt.assert_allclose(estimator.coef_, sparse_estimator.coef_, atol=1e-8)
+    npt.assert_allclose(estimator.intercept_, sparse_estimator.intercept_, atol=1e-8)
+    npt.assert_allclose(
+        estimator.predict(X), sparse_estimator.predict(X_sparse), atol=1e-8
+    )
+
+
 @pytest.mark.xfail(raises=SolverError)
 def test_add_constraints(estimator, random_model, rng):
     with pytest.raises(RuntimeError):
@@ -84,8 +181,7 @@ def test_add_constraints(estimator, random_model, rng):
     # force cache data
     # ( solving the model sometimes fails and we only want to check that a warning is
     # raised )
-    estimator.cached_X_ = X
-    estimator.cached_y_ = y
+    estimator._cache_data(X, y)
 
     new_X = rng.random(X.shape)
     with pytest.warns(UserWarning):
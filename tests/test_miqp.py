@@ -210,6 +210,16 @@ def test_group_hierarchy(estimator_cls, random_model_with_groups, miqp_solver, r
     )
 
 
+def test_default_tikhonov_objective(random_model):
+    # the default (tikhonov_w=None) ridge term should reduce to a plain
+    # quadratic in beta without materializing an identity matrix
+    X, y, beta = random_model
+    estimator = L2L0(eta=0.1)
+    estimator.generate_problem(X, y)
+    assert estimator.canonicals_.objective.is_quadratic()
+    assert estimator.canonicals_.problem.is_dpp()
+
+
 def test_set_parameters(random_model):
     X, y, beta = random_model
     estimator = RidgedBestSubsetSelection(sparse_bound=1, eta=1.0)